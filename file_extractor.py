@@ -24,20 +24,29 @@ SUMMARY OF CHANGES:
 """
 
 import os
-import tkinter as tk
-from tkinter import filedialog, ttk, messagebox, scrolledtext
-from typing import List, Dict, Any, Set
+import sys
+from typing import (
+    List, Dict, Any, Set, Tuple, Callable, FrozenSet, Iterable, Iterator, Optional,
+    Collection
+)
 import logging
 import threading
 import queue
-import asyncio
-import aiofiles
 import json
+import codecs
 import hashlib
+import time
 from datetime import datetime
 import fnmatch
-import configparser
-from logging.handlers import RotatingFileHandler
+import re
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+import atexit
+import functools
+import weakref
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Enhanced logging configuration
 log_handler = RotatingFileHandler(
@@ -46,11 +55,38 @@ log_handler = RotatingFileHandler(
     backupCount=5,
     encoding='utf-8'
 )
-logging.basicConfig(
-    handlers=[log_handler],
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s",
-)
+log_handler.setFormatter(logging.Formatter(
+    "%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s"
+))
+logging.basicConfig(handlers=[log_handler], level=logging.INFO)
+
+# While the GUI runs, callers only merge the message and any traceback and
+# enqueue the record; the line format, file writes and rotation happen on
+# the listener thread, so reader threads and the GUI never wait on disk
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, log_handler)
+
+def _start_log_listener() -> None:
+    """Send log records through the listener thread; started by main()."""
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(log_handler)
+    root_logger.addHandler(_queue_handler)
+    _log_listener.start()
+
+def _stop_log_listener() -> None:
+    """Write queued records and log directly to the file handler again."""
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    root_logger.addHandler(log_handler)
+    _log_listener.stop()
+
+def _load_tk() -> None:
+    """Import tkinter on first GUI use so non-GUI callers never load it."""
+    global tk, filedialog, ttk, messagebox, scrolledtext
+    import tkinter as tk
+    from tkinter import filedialog, ttk, messagebox, scrolledtext
 
 # Constants with added typing
 COMMON_EXTENSIONS: List[str] = [
@@ -63,22 +99,166 @@ DEFAULT_EXCLUDE: List[str] = [
     "node_modules", ".venv", ".pytest_cache"
 ]
 
+# Joined once and shared by the defaults and the GUI fallbacks
+_DEFAULT_EXCLUDE_STR: str = ', '.join(DEFAULT_EXCLUDE)
+
+DEFAULT_SETTINGS: Dict[str, str] = {
+    'output_file': 'output.txt',
+    'mode': 'inclusion',
+    'include_hidden': 'false',
+    'exclude_files': _DEFAULT_EXCLUDE_STR,
+    'exclude_folders': _DEFAULT_EXCLUDE_STR,
+    'theme': 'light',
+    'batch_size': '100',
+    'max_memory_mb': '512',
+    'hash_algorithm': 'sha256'
+}
+
+# Resolved once; avoids repeated platform checks and ctypes imports elsewhere
+_IS_WINDOWS: bool = sys.platform == "win32"
+_IS_POSIX_SEP: bool = os.sep == "/"
+
 SPECIFICATION_FILES: List[str] = ["README.md", "SPECIFICATIONS.md"]
-CHUNK_SIZE: int = 8192  # Optimal chunk size for file reading
+STREAM_THRESHOLD: int = 1 << 20  # Larger files are copied in chunks, not buffered
+COPY_CHUNK_SIZE: int = 1 << 20  # Read size when copying a large file
+OUTPUT_BUFFER_SIZE: int = 1 << 22  # 4MB write buffer for the output file
+MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB per-file limit
+# SHA-256 runs on SHA-NI/ARMv8 crypto instructions where OpenSSL provides them,
+# which makes it faster there than BLAKE2b; config.ini can pick another one
+HASH_ALGORITHM: str = DEFAULT_SETTINGS['hash_algorithm']
+# File reads release the GIL, so an I/O-sized pool scales well
+READ_WORKERS: int = min(32, (os.cpu_count() or 1) * 4)
+PROGRESS_INTERVAL: float = 0.25  # Seconds between progress reports to the GUI
+
+# Boolean spellings accepted in config.ini, as understood by configparser
+_TRUE_VALUES: FrozenSet[str] = frozenset({'1', 'yes', 'true', 'on'})
+_FALSE_VALUES: FrozenSet[str] = frozenset({'0', 'no', 'false', 'off'})
+_BOOL_VALUES: FrozenSet[str] = _TRUE_VALUES | _FALSE_VALUES
+
+VALID_MODES: FrozenSet[str] = frozenset({'inclusion', 'exclusion'})
+VALID_THEMES: FrozenSet[str] = frozenset({'light', 'dark'})
+# SHAKE digests need an explicit length, so they cannot be used by name alone
+VALID_HASH_ALGORITHMS: FrozenSet[str] = frozenset(
+    name for name in hashlib.algorithms_guaranteed if not name.startswith('shake_')
+)
+
+# Per-key validators; keys without an entry accept any string
+_VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    'mode': VALID_MODES.__contains__,
+    'theme': VALID_THEMES.__contains__,
+    'include_hidden': lambda value: value.lower() in _BOOL_VALUES,
+    'batch_size': str.isdigit,
+    'max_memory_mb': str.isdigit,
+    # 'none' turns content hashing off entirely
+    'hash_algorithm': lambda value: value == 'none' or value in VALID_HASH_ALGORITHMS,
+}
+
+def _is_valid_setting(key: str, value: str) -> bool:
+    """Check a single setting against the validator table."""
+    validator = _VALIDATORS.get(key)
+    return validator is None or validator(value)
+
+# Parsed configuration values keyed by (absolute path, mtime_ns, size)
+_PARSE_CACHE: Dict[Tuple[str, int, int], Dict[str, str]] = {}
+
+def _config_cache_key(config_file: str) -> Tuple[str, int, int]:
+    """Build the parse cache key for a configuration file."""
+    stat_result = os.stat(config_file)
+    return (os.path.abspath(config_file), stat_result.st_mtime_ns, stat_result.st_size)
+
+@functools.lru_cache(maxsize=64)
+def _split_list(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated setting into stripped, non-empty items."""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+# Splits at the first '=' or ':', as configparser's default delimiters do
+_OPTION_RE = re.compile(r"(?P<key>[^=:]+?)\s*[=:]\s*(?P<value>.*)")
+
+def _read_ini(config_file: str) -> Dict[str, str]:
+    """Read the [DEFAULT] section of an INI file with configparser's syntax."""
+    parsed: Dict[str, List[str]] = {}
+    section: Optional[str] = None
+    value_lines: Optional[List[str]] = None
+    key_indent = 0
+    with open(config_file, 'r', encoding='utf-8') as f:
+        for line_number, raw_line in enumerate(f.read().splitlines(), 1):
+            line = raw_line.strip()
+            if not line:
+                # Kept only if a continuation line follows; trailing ones are stripped
+                if value_lines is not None:
+                    value_lines.append('')
+                continue
+            if line[0] in '#;':
+                continue
+            indent = len(raw_line) - len(raw_line.lstrip())
+            if value_lines is not None and indent > key_indent:
+                value_lines.append(line)
+                continue
+            if line[0] == '[' and line[-1] == ']':
+                section = line[1:-1].strip()
+                value_lines = None
+                continue
+            if section is None:
+                raise ValueError(f"{config_file}, line {line_number}: missing section header")
+            match = _OPTION_RE.match(line)
+            if match is None:
+                raise ValueError(f"{config_file}, line {line_number}: expected 'key = value'")
+            key_indent = indent
+            value_lines = [match.group('value')]
+            if section == 'DEFAULT':
+                parsed[match.group('key').lower()] = value_lines
+    return {key: '\n'.join(lines).strip() for key, lines in parsed.items()}
+
+def _format_ini(values: Dict[str, str]) -> str:
+    """Serialize values as a [DEFAULT] section readable by configparser."""
+    # Continuation lines are indented, as configparser writes them
+    lines = "".join(
+        "{} = {}\n".format(key, value.replace("\n", "\n\t"))
+        for key, value in values.items()
+    )
+    return f"[DEFAULT]\n{lines}\n"
 
 class Config:
     """Configuration manager with improved error handling and validation."""
+
+    __slots__ = (
+        '_values', 'config_file', '_saved_values',
+        '_dirty', '_batch_depth', '_loaded', '__weakref__'
+    )
     
-    def __init__(self, config_file: str = 'config.ini'):
-        self.config = configparser.ConfigParser()
+    def __init__(self, config_file: str = 'config.ini', lazy: bool = False):
+        self._values: Dict[str, str] = {}
         self.config_file = config_file
-        self.load()
+        self._saved_values: Dict[str, str] = {}
+        self._dirty = False
+        self._batch_depth = 0
+        self._loaded = False
+        if not lazy:
+            self.load()
+        _LIVE_CONFIGS.add(self)
+
+    @property
+    def values(self) -> Dict[str, str]:
+        """Configuration values, loaded from disk on first access."""
+        if not self._loaded:
+            self.load()
+        return self._values
 
     def load(self) -> None:
         """Load configuration with error handling."""
+        self._loaded = True
         try:
             if os.path.exists(self.config_file):
-                self.config.read(self.config_file)
+                cache_key = _config_cache_key(self.config_file)
+                cached_values = _PARSE_CACHE.get(cache_key)
+                if cached_values is not None:
+                    self._values = dict(cached_values)
+                else:
+                    self._values = _read_ini(self.config_file)
+                    _PARSE_CACHE[cache_key] = dict(self._values)
+                # Remember what is on disk so unchanged saves can be skipped
+                self._saved_values = dict(self._values)
+                self._replace_invalid_values()
             else:
                 self.set_defaults()
                 logging.info(f"Created new configuration file: {self.config_file}")
@@ -87,207 +267,535 @@ class Config:
             self.set_defaults()
 
     def save(self) -> None:
-        """Save configuration with error handling."""
+        """Save configuration, deferring the write while a batch is open."""
+        self._dirty = True
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes, skipping the write when nothing has changed."""
+        if not self._dirty:
+            return
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
-            logging.debug("Configuration saved successfully")
+            current_values = dict(self.values)
+            if current_values == self._saved_values and os.path.exists(self.config_file):
+                logging.debug("Configuration unchanged, skipping save")
+            else:
+                # Write beside the target and swap it in, so a crash mid-write
+                # never leaves a truncated config.ini behind
+                temp_file = self.config_file + '.tmp'
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    f.write(_format_ini(current_values))
+                os.replace(temp_file, self.config_file)
+                self._saved_values = current_values
+                self._invalidate_parse_cache()
+                # Seed the cache with what was just written so the next
+                # Config() for this file does not parse it back in
+                _PARSE_CACHE[_config_cache_key(self.config_file)] = dict(current_values)
+                logging.debug("Configuration saved successfully")
+            self._dirty = False
         except Exception as e:
             logging.error(f"Error saving configuration: {str(e)}")
 
+    @contextmanager
+    def batch(self):
+        """Defer saves until the outermost batch exits, then write once."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def _replace_invalid_values(self) -> None:
+        """Fall back to defaults for values rejected by the validator table."""
+        for key, value in self._values.items():
+            if not _is_valid_setting(key, value):
+                logging.warning(f"Invalid config value for {key}: {value!r}, using default")
+                self._values[key] = DEFAULT_SETTINGS[key]
+
+    def _invalidate_parse_cache(self) -> None:
+        """Drop cached parse results for this configuration file."""
+        config_path = os.path.abspath(self.config_file)
+        for cache_key in [key for key in _PARSE_CACHE if key[0] == config_path]:
+            del _PARSE_CACHE[cache_key]
+
     def set_defaults(self) -> None:
         """Set default configuration values."""
-        self.config['DEFAULT'] = {
-            'output_file': 'output.txt',
-            'mode': 'inclusion',
-            'include_hidden': 'false',
-            'exclude_files': ', '.join(DEFAULT_EXCLUDE),
-            'exclude_folders': ', '.join(DEFAULT_EXCLUDE),
-            'theme': 'light',
-            'batch_size': '100',
-            'max_memory_mb': '512'
-        }
+        self._values = dict(DEFAULT_SETTINGS)
         self.save()
 
     def get(self, key: str, fallback: Any = None) -> Any:
         """Get configuration value with type checking."""
         try:
-            return self.config.get('DEFAULT', key, fallback=fallback)
+            return self.values.get(key, fallback)
         except Exception as e:
             logging.warning(f"Error getting config value for {key}: {str(e)}")
             return fallback
 
+    def get_bool(self, key: str, fallback: bool = False) -> bool:
+        """Get a boolean configuration value via a precomputed lookup."""
+        value = self.values.get(key)
+        if value is None:
+            return fallback
+        return value.lower() in _TRUE_VALUES
+
     def set(self, key: str, value: str) -> None:
         """Set configuration value with validation."""
         try:
-            self.config.set('DEFAULT', key, str(value))
+            value = str(value)
+            if self.values.get(key) == value:
+                return
+            if not _is_valid_setting(key, value):
+                logging.warning(f"Rejected invalid config value for {key}: {value!r}")
+                return
+            self.values[key] = value
             self.save()
         except Exception as e:
             logging.error(f"Error setting config value {key}: {str(e)}")
 
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several configuration values in place and save once."""
+        try:
+            with self.batch():
+                for key, value in values.items():
+                    self.set(key, value)
+        except Exception as e:
+            logging.error(f"Error updating configuration: {str(e)}")
+
+# Held weakly so pending writes are flushed at exit without keeping every
+# Config alive; one atexit hook serves all instances
+_LIVE_CONFIGS: "weakref.WeakSet[Config]" = weakref.WeakSet()
+
+def _flush_live_configs() -> None:
+    """Write any unsaved changes of configurations still alive at exit."""
+    for config in list(_LIVE_CONFIGS):
+        config.flush()
+
+atexit.register(_flush_live_configs)
+
+def _compile_patterns(patterns: Collection[str]) -> Optional["re.Pattern[str]"]:
+    """Compile glob patterns into one regex with fnmatch semantics."""
+    if not patterns:
+        return None
+    combined = "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns)
+    return re.compile(combined, re.IGNORECASE if _IS_WINDOWS else 0)
+
+@functools.lru_cache(maxsize=32)
+def _split_patterns(
+    patterns: FrozenSet[str]
+) -> Tuple[FrozenSet[str], Optional["re.Pattern[str]"]]:
+    """Split exclusions into literal names and one regex for real globs."""
+    literals = frozenset(
+        pattern.lower() if _IS_WINDOWS else pattern
+        for pattern in patterns
+        if not any(char in pattern for char in "*?[")
+    )
+    globs = [pattern for pattern in patterns
+             if any(char in pattern for char in "*?[")]
+    return literals, _compile_patterns(globs)
+
+def _iter_files(
+    folder_path: str,
+    include_hidden: bool,
+    exclude_files: Collection[str],
+    exclude_folders: Collection[str]
+) -> Iterator[os.DirEntry]:
+    """Yield candidate file DirEntry objects in os.walk order."""
+    exclude_file_names, exclude_file_rx = _split_patterns(frozenset(exclude_files))
+    exclude_folder_names, exclude_folder_rx = _split_patterns(frozenset(exclude_folders))
+    # Directory names repeat across a tree (src, tests, build, ...), so glob
+    # answers are memoized per walk; file names are mostly unique and are not
+    folder_glob_excluded = (
+        functools.lru_cache(maxsize=4096)(
+            lambda name: exclude_folder_rx.match(name) is not None
+        )
+        if exclude_folder_rx else None
+    )
+    skip_hidden = not include_hidden
+    pending = [folder_path]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directories are skipped, as os.walk does
+
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            # Hidden entries are dropped inline while scanning, no filtered copy
+            if skip_hidden and name[:1] == ".":
+                continue
+            key = name.lower() if _IS_WINDOWS else name
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if is_dir:
+                # Symlinked directories are not followed, matching os.walk
+                if (not entry.is_symlink() and key not in exclude_folder_names
+                        and not (folder_glob_excluded and folder_glob_excluded(name))):
+                    subdirs.append(entry.path)
+            elif key not in exclude_file_names and not (
+                    exclude_file_rx and exclude_file_rx.match(name)):
+                yield entry
+
+        # Reverse so the first subdirectory is visited next (depth-first)
+        pending.extend(reversed(subdirs))
+
 class FileProcessor:
     """Enhanced file processor with improved error handling and performance."""
 
-    def __init__(self, output_queue: queue.Queue):
+    def __init__(
+        self,
+        output_queue: queue.Queue,
+        notify: Optional[Callable[[], None]] = None
+    ):
         self.output_queue = output_queue
-        self.extraction_summary: Dict[str, Any] = {}
+        # None skips hashing; reports then carry null hashes
+        self.hash_algorithm: Optional[str] = HASH_ALGORITHM
+        # Called after each queued message so the GUI drains on demand
+        self.notify = notify
+        # Per-extension [count, total_size] plus per-file columns (struct of
+        # arrays) instead of one dict mixing both kinds of entries
+        self.extension_totals: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        self.file_paths: List[str] = []
+        self.file_sizes = array('Q')
+        self.file_hashes: List[Optional[str]] = []
+        self.file_extensions: List[str] = []
+        # Epoch seconds; formatted only when a report is written
+        self.file_times = array('d')
         self.processed_files: Set[str] = set()
         self._cache: Dict[str, Any] = {}
 
-    async def process_specifications(self, directory_path: str, output_file: Any) -> None:
+    def _post(self, message_type: str, message: str) -> None:
+        """Queue a message for the GUI and signal that output is waiting."""
+        self.output_queue.put((message_type, message))
+        if self.notify is not None:
+            self.notify()
+
+    def process_specifications(self, directory_path: str, output_file: Any) -> None:
         """Process specification files first with enhanced error handling."""
         for spec_file in SPECIFICATION_FILES:
             try:
                 file_path = os.path.join(directory_path, spec_file)
                 if os.path.exists(file_path) and os.path.isfile(file_path):
                     logging.info(f"Processing specification file: {spec_file}")
-                    await self.process_file(file_path, output_file)
+                    self.process_file(file_path, output_file)
                     self.processed_files.add(file_path)
             except Exception as e:
                 logging.error(f"Error processing specification file {spec_file}: {str(e)}")
-                self.output_queue.put(("error", f"Error processing {spec_file}: {str(e)}"))
+                self._post("error", f"Error processing {spec_file}: {str(e)}")
 
-    async def process_file(self, file_path: str, output_file: Any) -> None:
+    def process_file(self, file_path: str, output_file: Any) -> None:
         """Process individual file with improved error handling and memory management."""
         try:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
-
-            if not os.access(file_path, os.R_OK):
-                raise PermissionError(f"Permission denied: {file_path}")
-
-            # Use file size check to prevent memory issues
-            file_size = os.path.getsize(file_path)
-            if file_size > 100 * 1024 * 1024:  # 100MB limit
-                raise MemoryError(f"File too large to process: {file_path}")
-
-            normalized_path = os.path.normpath(file_path).replace(os.path.sep, "/")
-            
-            # Process file in chunks for better memory management
-            content = []
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                while chunk := await f.read(CHUNK_SIZE):
-                    content.append(chunk)
-
-            file_content = "".join(content)
-            await output_file.write(f"{normalized_path}:\n{file_content}\n\n\n")
-
-            # Update extraction summary
             file_ext = os.path.splitext(file_path)[1]
-            file_hash = hashlib.md5(file_content.encode()).hexdigest()
-
-            self._update_extraction_summary(file_ext, file_path, file_size, file_hash)
-            
-            logging.debug(f"Successfully processed file: {file_path}")
-
-        except (UnicodeDecodeError, UnicodeError) as e:
-            logging.warning(f"Unicode decode error for {file_path}: {str(e)}")
-            self.output_queue.put(("error", f"Cannot decode file {file_path}: {str(e)}"))
+            file_content, file_size, file_hash = self._read_file(file_path)
+            self._write_file(
+                file_path, file_ext, file_content, file_size, file_hash, output_file
+            )
         except Exception as e:
-            logging.error(f"Error processing file {file_path}: {str(e)}")
-            self.output_queue.put(("error", f"Error processing {file_path}: {str(e)}"))
+            self._report_file_error(file_path, e)
+
+    def _read_file(
+        self, file_path: str, file_size: Optional[int] = None
+    ) -> Tuple[Optional[bytes], int, Optional[str]]:
+        """Read, validate and hash a file on a reader thread.
+
+        Returns ``(content, size, hash)``; content and hash are ``None`` for
+        files above STREAM_THRESHOLD, which the writer copies in chunks.
+        """
+        if file_size is None:
+            file_size = os.stat(file_path).st_size
+
+        # Use file size check to prevent memory issues
+        if file_size > MAX_FILE_SIZE:
+            raise MemoryError(f"File too large to process: {file_path}")
+
+        if file_size > STREAM_THRESHOLD:
+            return None, file_size, None
+
+        # Raw bytes are hashed and written as-is. The file is slurped in one
+        # read, so an unbuffered handle skips allocating a BufferedReader and
+        # its 8KB buffer per file
+        with open(file_path, "rb", buffering=0) as f:
+            file_content = f.read()
+        # Decoding is only a check that keeps binary files out of the output;
+        # the text is discarded and UnicodeDecodeError rejects the file
+        file_content.decode("utf-8")
+        if self.hash_algorithm is None:
+            return file_content, len(file_content), None
+        file_hash = hashlib.new(self.hash_algorithm, file_content).hexdigest()
+        return file_content, len(file_content), file_hash
+
+    def _write_file(
+        self,
+        file_path: str,
+        file_ext: str,
+        file_content: Optional[bytes],
+        file_size: int,
+        file_hash: Optional[str],
+        output_file: Any
+    ) -> None:
+        """Append file content to the output and record it in the summary."""
+        normalized_path = file_path if _IS_POSIX_SEP else file_path.replace(os.sep, "/")
+        if file_content is None:
+            file_hash = self._stream_file(file_path, normalized_path, output_file)
+        else:
+            output_file.write(f"{normalized_path}:\n".encode())
+            output_file.write(file_content)
+            output_file.write(b"\n\n\n")
+
+        # Update extraction summary
+        self._update_extraction_summary(file_ext, file_path, file_size, file_hash)
+        
+        logging.debug(f"Successfully processed file: {file_path}")
+
+    def _stream_file(
+        self, file_path: str, normalized_path: str, output_file: Any
+    ) -> Optional[str]:
+        """Copy a large UTF-8 file into the output in chunks; returns its hash."""
+        file_hash = (
+            hashlib.new(self.hash_algorithm) if self.hash_algorithm is not None else None
+        )
+        entry_start = output_file.tell()
+        try:
+            output_file.write(f"{normalized_path}:\n".encode())
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            buffer = memoryview(bytearray(COPY_CHUNK_SIZE))
+            with open(file_path, "rb", buffering=0) as f:
+                remaining = os.fstat(f.fileno()).st_size
+                while remaining > 0:
+                    read_size = f.readinto(buffer[:remaining])
+                    if not read_size:
+                        break
+                    chunk = buffer[:read_size]
+                    decoder.decode(chunk)
+                    if file_hash is not None:
+                        file_hash.update(chunk)
+                    output_file.write(chunk)
+                    remaining -= read_size
+            decoder.decode(b"", final=True)
+            output_file.write(b"\n\n\n")
+        except Exception:
+            output_file.seek(entry_start)
+            output_file.truncate()
+            raise
+        return file_hash.hexdigest() if file_hash is not None else None
+
+    def _report_file_error(self, file_path: str, error: Exception) -> None:
+        """Log a per-file failure and forward it to the GUI."""
+        if isinstance(error, UnicodeError):
+            # Binary or non-UTF-8 files are skipped, not written to the output
+            logging.warning(f"Unicode decode error for {file_path}: {str(error)}")
+            self._post("error", f"Cannot decode file {file_path}: {str(error)}")
+            return
+        logging.error(f"Error processing file {file_path}: {str(error)}")
+        self._post("error", f"Error processing {file_path}: {str(error)}")
 
-    def _update_extraction_summary(self, file_ext: str, file_path: str, file_size: int, file_hash: str) -> None:
+    def _process_files_parallel(
+        self,
+        file_infos: Iterable[Tuple[str, str, Optional[int]]],
+        output_file: Any,
+        progress_callback: Callable[[int, Optional[int]], None]
+    ) -> int:
+        """Read files on a thread pool while writing them in walk order.
+
+        ``file_infos`` yields ``(path, extension, size)``; returns the number
+        of files processed.
+        """
+        total_files: Optional[int] = None
+        submitted_files = 0
+        processed_files = 0
+        remaining = iter(file_infos)
+        pending: deque = deque()
+        last_report = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=READ_WORKERS,
+                                thread_name_prefix="FileReader") as executor:
+            def submit_next() -> None:
+                nonlocal total_files, submitted_files
+                for next_path, next_ext, next_size in remaining:
+                    pending.append((
+                        next_path,
+                        next_ext,
+                        executor.submit(self._read_file, next_path, next_size)
+                    ))
+                    submitted_files += 1
+                    return
+                total_files = submitted_files
+
+            for _ in range(READ_WORKERS * 2):
+                submit_next()
+
+            while pending:
+                file_path, file_ext, read_future = pending.popleft()
+                submit_next()
+                try:
+                    file_content, file_size, file_hash = read_future.result()
+                    self._write_file(
+                        file_path, file_ext, file_content, file_size, file_hash,
+                        output_file
+                    )
+                except Exception as e:
+                    self._report_file_error(file_path, e)
+                processed_files += 1
+                now = time.monotonic()
+                if now - last_report >= PROGRESS_INTERVAL:
+                    last_report = now
+                    progress_callback(processed_files, total_files)
+
+        progress_callback(processed_files, processed_files)
+        return processed_files
+
+    def _update_extraction_summary(
+        self, file_ext: str, file_path: str, file_size: int, file_hash: Optional[str]
+    ) -> None:
         """Update extraction summary with thread safety."""
         try:
-            if file_ext not in self.extraction_summary:
-                self.extraction_summary[file_ext] = {"count": 0, "total_size": 0}
-            
-            self.extraction_summary[file_ext]["count"] += 1
-            self.extraction_summary[file_ext]["total_size"] += file_size
-
-            self.extraction_summary[file_path] = {
-                "size": file_size,
-                "hash": file_hash,
-                "extension": file_ext,
-                "processed_time": datetime.now().isoformat()
-            }
+            totals = self.extension_totals[file_ext]
+            totals[0] += 1
+            totals[1] += file_size
+
+            self.file_paths.append(file_path)
+            self.file_sizes.append(file_size)
+            self.file_hashes.append(file_hash)
+            # Interned so the per-file column holds one string per extension
+            self.file_extensions.append(sys.intern(file_ext))
+            self.file_times.append(time.time())
         except Exception as e:
             logging.error(f"Error updating extraction summary: {str(e)}")
 
-    async def extract_files(
+    def write_report(self, report_file: str) -> None:
+        """Stream the extraction report to disk one file entry at a time."""
+        dumps = json.dumps
+        fromtimestamp = datetime.fromtimestamp
+        with open(report_file, "w", encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as f:
+            f.write('{\n')
+            f.write(f'  "timestamp": {dumps(datetime.now().isoformat())},\n')
+            f.write(f'  "hash_algorithm": {dumps(self.hash_algorithm)},\n')
+            f.write(f'  "total_files": {len(self.file_paths)},\n')
+            f.write(f'  "total_size": {sum(self.file_sizes)},\n')
+            f.write('  "extension_summary": ')
+            f.write(dumps(
+                {
+                    ext: {"count": count, "total_size": total_size}
+                    for ext, (count, total_size) in self.extension_totals.items()
+                },
+                ensure_ascii=False
+            ))
+            f.write(',\n  "file_details": {')
+            separator = '\n'
+            for path, size, file_hash, ext, processed_time in zip(
+                self.file_paths, self.file_sizes, self.file_hashes,
+                self.file_extensions, self.file_times
+            ):
+                f.write(
+                    f'{separator}    {dumps(path, ensure_ascii=False)}: '
+                    f'{{"size": {size}, "hash": {dumps(file_hash)}, '
+                    f'"extension": {dumps(ext, ensure_ascii=False)}, '
+                    f'"processed_time": "{fromtimestamp(processed_time).isoformat()}"}}'
+                )
+                separator = ',\n'
+            f.write('\n  }\n}\n')
+
+    def clear_summary(self) -> None:
+        """Discard the statistics collected by a previous extraction."""
+        self.extension_totals.clear()
+        self.file_paths.clear()
+        del self.file_sizes[:]
+        self.file_hashes.clear()
+        self.file_extensions.clear()
+        del self.file_times[:]
+
+    def _iter_matches(
+        self,
+        folder_path: str,
+        include_hidden: bool,
+        exclude_files: Collection[str],
+        exclude_folders: Collection[str],
+        ext_tuple: Tuple[str, ...],
+        mode: str
+    ) -> Iterator[Tuple[str, str, Optional[int]]]:
+        """Yield ``(path, extension, size)`` for each file selected by mode."""
+        if mode not in VALID_MODES:
+            return
+        keep_matching = mode == "inclusion"
+        processed = self.processed_files
+        for entry in _iter_files(
+                folder_path, include_hidden, exclude_files, exclude_folders):
+            name = entry.name
+            if name.lower().endswith(ext_tuple) is not keep_matching:
+                continue
+            file_path = entry.path
+            if file_path in processed:
+                continue
+            try:
+                # Cached from the directory read on Windows
+                file_size: Optional[int] = entry.stat().st_size
+            except OSError:
+                file_size = None  # Let the reader report the error
+            yield file_path, os.path.splitext(name)[1], file_size
+
+    def extract_files(
         self,
         folder_path: str,
         mode: str,
         include_hidden: bool,
-        extensions: List[str],
-        exclude_files: List[str],
-        exclude_folders: List[str],
+        extensions: Collection[str],
+        exclude_files: Collection[str],
+        exclude_folders: Collection[str],
         output_file_name: str,
-        progress_callback: callable
+        progress_callback: Callable[[int, Optional[int]], None]
     ) -> None:
         """Extract files with improved error handling and progress reporting."""
-        
-        total_files = 0
-        processed_files = 0
+        # Normalized once here; paths joined onto it by the walk stay clean,
+        # so per-file output headers only need a separator swap
+        folder_path = os.path.normpath(folder_path)
+
+        # One C-level endswith call per name replaces splitext plus a set
+        # lookup; matching is case-insensitive and, as with splitext, only
+        # dotted extensions can match
+        ext_tuple = tuple({ext.lower() for ext in extensions if ext.startswith(".")})
 
         try:
-            async with aiofiles.open(output_file_name, "w", encoding="utf-8") as output_file:
+            with open(output_file_name, "wb",
+                      buffering=OUTPUT_BUFFER_SIZE) as output_file:
                 # Process specification files first
-                await self.process_specifications(folder_path, output_file)
+                self.process_specifications(folder_path, output_file)
                 
-                # Count total files for progress tracking
-                for root, dirs, files in os.walk(folder_path):
-                    if not include_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith(".")]
-                        files = [f for f in files if not f.startswith(".")]
-
-                    dirs[:] = [d for d in dirs if not any(
-                        fnmatch.fnmatch(d, pattern) for pattern in exclude_folders)]
-
-                    files = [f for f in files if not any(
-                        fnmatch.fnmatch(f, pattern) for pattern in exclude_files)]
-
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if file_path in self.processed_files:
-                            continue
-
-                        file_ext = os.path.splitext(file)[1]
-                        if ((mode == "inclusion" and file_ext in extensions) or
-                            (mode == "exclusion" and file_ext not in extensions)):
-                            total_files += 1
-
-                # Process remaining files
-                for root, dirs, files in os.walk(folder_path):
-                    if not include_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith(".")]
-                        files = [f for f in files if not f.startswith(".")]
-
-                    dirs[:] = [d for d in dirs if not any(
-                        fnmatch.fnmatch(d, pattern) for pattern in exclude_folders)]
-
-                    files = [f for f in files if not any(
-                        fnmatch.fnmatch(f, pattern) for pattern in exclude_files)]
-
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        if file_path in self.processed_files:
-                            continue
-
-                        file_ext = os.path.splitext(file)[1]
-                        if ((mode == "inclusion" and file_ext in extensions) or
-                            (mode == "exclusion" and file_ext not in extensions)):
-                            await self.process_file(file_path, output_file)
-                            processed_files += 1
-                            await progress_callback(processed_files, total_files)
-
-                self.output_queue.put((
+                # Files are read as the walk finds them, so reading overlaps
+                # the traversal instead of waiting for it to finish
+                processed_files = self._process_files_parallel(
+                    self._iter_matches(
+                        folder_path, include_hidden, exclude_files,
+                        exclude_folders, ext_tuple, mode
+                    ),
+                    output_file, progress_callback
+                )
+
+                self._post(
                     "info",
                     f"Extraction complete. Processed {processed_files} files. "
                     f"Results written to {output_file_name}."
-                ))
+                )
 
         except Exception as e:
             error_msg = f"Error during extraction: {str(e)}"
             logging.error(error_msg)
-            self.output_queue.put(("error", error_msg))
+            self._post("error", error_msg)
             raise
 
 class FileExtractorGUI:
     """Enhanced GUI with improved responsiveness and error handling."""
 
     def __init__(self, master):
+        _load_tk()
         self.master = master
         self.master.title("File Extractor Pro")
         self.master.geometry("700x700")
@@ -295,21 +803,23 @@ class FileExtractorGUI:
 
         # Initialize components with better error handling
         try:
-            self.config = Config()
+            # Defer reading config.ini until the window has been drawn
+            self.config = Config(lazy=True)
             self.setup_variables()
             self.setup_ui_components()
             self.connect_event_handlers()
             
             # Initialize processing state
             self.extraction_in_progress = False
-            self.loop = None
             self.thread = None
-            
-            # Apply initial theme
-            self.apply_theme(self.config.get('theme', 'light'))
+            self.report_in_progress = False
+            # Set on close so workers stop signalling a window that is gone
+            self.window_closed = False
             
             # Set initial status
             self.status_var.set("Ready")
+            self.settings_loaded = False
+            self.master.after_idle(self.load_settings)
             
         except Exception as e:
             logging.error(f"Error initializing GUI: {str(e)}")
@@ -320,23 +830,54 @@ class FileExtractorGUI:
     def setup_variables(self) -> None:
         """Initialize all GUI variables with proper typing."""
         self.folder_path = tk.StringVar(value="")
-        self.output_file_name = tk.StringVar(value=self.config.get('output_file', 'output.txt'))
-        self.mode = tk.StringVar(value=self.config.get('mode', 'inclusion'))
-        self.include_hidden = tk.BooleanVar(
-            value=self.config.get('include_hidden', 'false').lower() == 'true'
-        )
+        self.output_file_name = tk.StringVar(value=DEFAULT_SETTINGS['output_file'])
+        self.mode = tk.StringVar(value=DEFAULT_SETTINGS['mode'])
+        self.include_hidden = tk.BooleanVar(value=False)
         self.extension_vars = {
             ext: tk.BooleanVar(value=True) for ext in COMMON_EXTENSIONS
         }
         self.custom_extensions = tk.StringVar()
-        self.exclude_files = tk.StringVar(
-            value=self.config.get('exclude_files', ', '.join(DEFAULT_EXCLUDE))
-        )
-        self.exclude_folders = tk.StringVar(
-            value=self.config.get('exclude_folders', ', '.join(DEFAULT_EXCLUDE))
-        )
+        self.exclude_files = tk.StringVar(value=DEFAULT_SETTINGS['exclude_files'])
+        self.exclude_folders = tk.StringVar(value=DEFAULT_SETTINGS['exclude_folders'])
+        # Parsed once per edit rather than on every extraction
+        self._custom_extensions_set: FrozenSet[str] = frozenset()
+        self._exclude_files_set: FrozenSet[str] = frozenset()
+        self._exclude_folders_set: FrozenSet[str] = frozenset()
+        self._cache_list_var(self.custom_extensions, '_custom_extensions_set')
+        self._cache_list_var(self.exclude_files, '_exclude_files_set')
+        self._cache_list_var(self.exclude_folders, '_exclude_folders_set')
         self.output_queue = queue.Queue()
-        self.file_processor = FileProcessor(self.output_queue)
+        self.file_processor = FileProcessor(self.output_queue, self._notify_output)
+
+    def _cache_list_var(self, var: "tk.StringVar", attr: str) -> None:
+        """Keep ``attr`` in sync with the comma-separated entries of ``var``."""
+        def update(*_) -> None:
+            setattr(self, attr, frozenset(_split_list(var.get())))
+
+        var.trace_add('write', update)
+        update()
+
+    def load_settings(self) -> None:
+        """Load the configuration file and apply it to the GUI variables."""
+        try:
+            self.output_file_name.set(self.config.get('output_file', 'output.txt'))
+            self.mode.set(self.config.get('mode', 'inclusion'))
+            self.include_hidden.set(self.config.get_bool('include_hidden'))
+            self.exclude_files.set(
+                self.config.get('exclude_files', _DEFAULT_EXCLUDE_STR)
+            )
+            self.exclude_folders.set(
+                self.config.get('exclude_folders', _DEFAULT_EXCLUDE_STR)
+            )
+            self.apply_theme(self.config.get('theme', 'light'))
+            hash_algorithm = self.config.get('hash_algorithm', HASH_ALGORITHM)
+            self.file_processor.hash_algorithm = (
+                None if hash_algorithm == 'none' else hash_algorithm
+            )
+            self.settings_loaded = True
+            logging.debug("Settings loaded into GUI")
+        except Exception as e:
+            logging.error(f"Error loading settings: {str(e)}")
 
     def setup_ui_components(self) -> None:
         """Set up UI components with improved layout and error handling."""
@@ -506,11 +1047,15 @@ class FileExtractorGUI:
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.master.bind("<F5>", lambda e: self.execute())
         self.master.bind("<Escape>", lambda e: self.cancel_extraction())
+        self.master.bind("<<Output>>", self._drain_queue)
 
     def browse_folder(self) -> None:
         """Handle folder selection with improved error checking."""
         try:
             folder_selected = filedialog.askdirectory()
+            if folder_selected and folder_selected == self.folder_path.get():
+                # Re-selecting the current folder changes nothing
+                return
             if folder_selected:
                 self.folder_path.set(folder_selected)
                 # Update output filename based on folder name
@@ -547,19 +1092,25 @@ class FileExtractorGUI:
         selected_extensions = [
             ext for ext, var in self.extension_vars.items() if var.get()
         ]
-        custom_exts = [
-            ext.strip() for ext in self.custom_extensions.get().split(",") 
-            if ext.strip()
-        ]
-        
-        if not (selected_extensions or custom_exts):
+        if not (selected_extensions or self._custom_extensions_set):
             raise ValueError("Please select at least one file extension.")
 
+        # A new extraction clears the summary the report writer is reading
+        if self.report_in_progress:
+            raise ValueError("Please wait until the report has been saved.")
+
+        # A cancelled worker keeps running; a second one would share the
+        # summary with it and its "done" message would end the new run
+        if self.thread and self.thread.is_alive():
+            raise ValueError("Please wait for the cancelled extraction to finish.")
+
     def prepare_extraction(self) -> None:
         """Prepare for extraction process."""
         self.output_text.delete(1.0, tk.END)
         self.progress_var.set(0)
-        self.file_processor.extraction_summary.clear()
+        # The total is unknown until the walk finishes
+        self._set_progress_mode("indeterminate")
+        self.file_processor.clear_summary()
         self.extraction_in_progress = True
         self.extract_button.config(state="disabled")
         self.status_var.set("Extraction in progress...")
@@ -572,21 +1123,13 @@ class FileExtractorGUI:
         mode = self.mode.get()
         include_hidden = self.include_hidden.get()
         
-        extensions = [
-            ext for ext, var in self.extension_vars.items() if var.get()
-        ]
-        custom_exts = [
-            ext.strip() for ext in self.custom_extensions.get().split(",") 
-            if ext.strip()
-        ]
-        extensions.extend(custom_exts)
-        
-        exclude_files = [
-            f.strip() for f in self.exclude_files.get().split(",") if f.strip()
-        ]
-        exclude_folders = [
-            f.strip() for f in self.exclude_folders.get().split(",") if f.strip()
-        ]
+        # Frozensets give O(1) membership in the walk and drop duplicates
+        extensions = frozenset((
+            *(ext for ext, var in self.extension_vars.items() if var.get()),
+            *self._custom_extensions_set
+        ))
+        exclude_files = self._exclude_files_set
+        exclude_folders = self._exclude_folders_set
 
         self.thread = threading.Thread(
             target=self.run_extraction_thread,
@@ -597,115 +1140,152 @@ class FileExtractorGUI:
             daemon=True
         )
         self.thread.start()
-        self.master.after(100, self.check_queue)
 
     def run_extraction_thread(self, *args) -> None:
         """Run the extraction process in a separate thread."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
         try:
-            self.loop.run_until_complete(
-                self.file_processor.extract_files(*args, self.update_progress)
-            )
+            self.file_processor.extract_files(*args, self.update_progress)
         except Exception as e:
             logging.error(f"Error in extraction thread: {str(e)}")
             self.output_queue.put(("error", f"Extraction error: {str(e)}"))
         finally:
-            self.loop.close()
-
-    async def update_progress(self, processed_files: int, total_files: int) -> None:
-        """Update progress bar and status with error handling."""
+            self.output_queue.put(("done", ""))
+            self._notify_output()
+
+    def update_progress(self, processed_files: int, total_files: Optional[int]) -> None:
+        """Queue a progress update for the Tk thread; called from the worker."""
+        # Progress shares the message queue and <<Output>> event, so the
+        # worker never touches Tk variables and bursts collapse into one redraw
+        self.output_queue.put(("progress", (processed_files, total_files)))
+        self._notify_output()
+
+    def _notify_output(self) -> None:
+        """Ask the Tk thread to drain the message queue; safe from workers."""
+        if self.window_closed:
+            return
         try:
-            progress = (processed_files / total_files * 100) if total_files > 0 else 0
-            self.master.after(0, lambda: self.progress_var.set(progress))
-            self.master.after(
-                0,
-                lambda: self.status_var.set(
-                    f"Processing: {processed_files}/{total_files} files"
-                )
-            )
-        except Exception as e:
-            logging.error(f"Error updating progress: {str(e)}")
+            self.master.event_generate("<<Output>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # The window is being destroyed, or mainloop has already ended
+            pass
 
-    def check_queue(self) -> None:
-        """Check message queue with improved error handling."""
+    def _drain_queue(self, event=None) -> None:
+        """Apply queued progress and append messages with a single insert."""
+        runs: List[Tuple[str, List[str]]] = []
+        progress = None
+        finished = False
         try:
             while True:
                 message_type, message = self.output_queue.get_nowait()
                 if message_type == "info":
-                    self.output_text.insert(tk.END, message + "\n", "info")
+                    line = message + "\n"
                 elif message_type == "error":
-                    self.output_text.insert(tk.END, "ERROR: " + message + "\n", "error")
-                    logging.error(message)
-                
-                self.output_text.see(tk.END)
-                self.output_text.update_idletasks()
-                
+                    line = "ERROR: " + message + "\n"
+                else:
+                    if message_type == "progress":
+                        progress = message  # Only the latest update matters
+                    elif message_type == "done":
+                        finished = True
+                    continue
+                if runs and runs[-1][0] == message_type:
+                    runs[-1][1].append(line)
+                else:
+                    runs.append((message_type, [line]))
         except queue.Empty:
             pass
-        finally:
-            if self.extraction_in_progress:
-                self.master.after(100, self.check_queue)
-            else:
+
+        segments: List[str] = []
+        for tag, lines in runs:
+            segments += ("".join(lines), tag)
+
+        try:
+            if progress is not None:
+                processed_files, total_files = progress
+                if total_files is None:
+                    # Still walking: the bar keeps pulsing and only the count moves
+                    self.status_var.set(f"Processed: {processed_files} files")
+                else:
+                    self._set_progress_mode("determinate")
+                    self.progress_var.set(
+                        (processed_files / total_files * 100) if total_files > 0 else 0
+                    )
+                    self.status_var.set(
+                        f"Processing: {processed_files}/{total_files} files"
+                    )
+            if segments:
+                self.output_text.insert(tk.END, *segments)
+                self.output_text.see(tk.END)
+                self.output_text.update_idletasks()
+            if finished and self.extraction_in_progress:
                 self.reset_extraction_state()
+        except Exception as e:
+            logging.error(f"Error updating output: {str(e)}")
 
     def generate_report(self) -> None:
         """Generate extraction report with improved formatting and error handling."""
-        if not self.file_processor.extraction_summary:
+        processor = self.file_processor
+        if self.report_in_progress:
+            messagebox.showinfo("Info", "A report is already being generated.")
+            return
+        # The cancelled worker may still be appending to the summary
+        if self.extraction_in_progress or (self.thread and self.thread.is_alive()):
+            messagebox.showinfo(
+                "Info",
+                "Please wait for the extraction to finish before generating a report."
+            )
+            return
+        if not processor.file_paths:
             messagebox.showinfo(
                 "Info",
                 "No extraction data available. Please run an extraction first."
             )
             return
 
-        try:
-            report = {
-                "timestamp": datetime.now().isoformat(),
-                "total_files": sum(
-                    ext_info["count"]
-                    for ext_info in self.file_processor.extraction_summary.values()
-                    if isinstance(ext_info, dict) and "count" in ext_info
-                ),
-                "total_size": sum(
-                    ext_info["total_size"]
-                    for ext_info in self.file_processor.extraction_summary.values()
-                    if isinstance(ext_info, dict) and "total_size" in ext_info
-                ),
-                "extension_summary": {
-                    ext: ext_info
-                    for ext, ext_info in self.file_processor.extraction_summary.items()
-                    if isinstance(ext_info, dict) and "count" in ext_info
-                },
-                "file_details": {
-                    path: details
-                    for path, details in self.file_processor.extraction_summary.items()
-                    if isinstance(details, dict) and "size" in details
-                }
-            }
-
-            report_file = "extraction_report.json"
-            with open(report_file, "w", encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+        report_file = "extraction_report.json"
+        self.report_in_progress = True
+        threading.Thread(
+            target=self._write_report_thread, args=(report_file,), daemon=True
+        ).start()
 
-            messagebox.showinfo(
-                "Report Generated",
+    def _write_report_thread(self, report_file: str) -> None:
+        """Write the report off the Tk thread and post the outcome back."""
+        try:
+            self.file_processor.write_report(report_file)
+            logging.info(f"Report generated successfully: {report_file}")
+            outcome = (
+                messagebox.showinfo, "Report Generated",
                 f"Extraction report has been saved to {report_file}"
             )
-            logging.info(f"Report generated successfully: {report_file}")
-            
         except Exception as e:
             error_msg = f"Error generating report: {str(e)}"
             logging.error(error_msg)
-            messagebox.showerror("Error", error_msg)
+            outcome = (messagebox.showerror, "Error", error_msg)
+        if self.window_closed:
+            return
+        try:
+            self.master.after(0, self._finish_report, *outcome)
+        except (tk.TclError, RuntimeError):
+            # The window is being destroyed, or mainloop has already ended
+            pass
+
+    def _finish_report(self, show: Callable[[str, str], Any], title: str, message: str) -> None:
+        """Allow the next report and show the outcome; runs on the Tk thread."""
+        self.report_in_progress = False
+        show(title, message)
 
     def save_config(self) -> None:
         """Save current configuration with error handling."""
+        if not self.settings_loaded:
+            # Never overwrite config.ini with the placeholder defaults
+            return
         try:
-            self.config.set('output_file', self.output_file_name.get())
-            self.config.set('mode', self.mode.get())
-            self.config.set('include_hidden', str(self.include_hidden.get()))
-            self.config.set('exclude_files', self.exclude_files.get())
-            self.config.set('exclude_folders', self.exclude_folders.get())
+            self.config.update({
+                'output_file': self.output_file_name.get(),
+                'mode': self.mode.get(),
+                'include_hidden': str(self.include_hidden.get()),
+                'exclude_files': self.exclude_files.get(),
+                'exclude_folders': self.exclude_folders.get()
+            })
             logging.debug("Configuration saved successfully")
         except Exception as e:
             logging.error(f"Error saving configuration: {str(e)}")
@@ -752,8 +1332,20 @@ class FileExtractorGUI:
         except Exception as e:
             logging.error(f"Error applying theme: {str(e)}")
 
+    def _set_progress_mode(self, mode: str) -> None:
+        """Switch the progress bar between pulsing and percentage display."""
+        if str(self.progress_bar.cget("mode")) == mode:
+            return
+        if mode == "indeterminate":
+            self.progress_bar.config(mode=mode)
+            self.progress_bar.start(10)
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.config(mode=mode)
+
     def reset_extraction_state(self) -> None:
         """Reset the application state after extraction."""
+        self._set_progress_mode("determinate")
         self.extraction_in_progress = False
         self.extract_button.config(state="normal")
         self.status_var.set("Ready")
@@ -768,9 +1360,17 @@ class FileExtractorGUI:
                 self.output_queue.put(("info", "Extraction cancelled by user"))
                 logging.info("Extraction cancelled by user")
             self.reset_extraction_state()
+            self._drain_queue()
 
     def on_closing(self) -> None:
         """Handle application closing with proper cleanup."""
+        if self.report_in_progress:
+            # The writer is a daemon thread; exiting now would leave a
+            # truncated extraction_report.json behind
+            messagebox.showinfo(
+                "Info", "Please wait until the report has been saved before exiting."
+            )
+            return
         if self.extraction_in_progress:
             if not messagebox.askyesno(
                 "Confirm Exit",
@@ -779,6 +1379,7 @@ class FileExtractorGUI:
                 return
             self.cancel_extraction()
         
+        self.window_closed = True
         try:
             self.save_config()
             logging.info("Application closed normally")
@@ -788,22 +1389,30 @@ class FileExtractorGUI:
             self.master.destroy()
 
 
+def configure_dpi_awareness() -> None:
+    """Enable DPI awareness on Windows; a no-op on other platforms."""
+    if not _IS_WINDOWS:
+        return
+    try:
+        from ctypes import windll
+        windll.shcore.SetProcessDpiAwareness(1)
+    except Exception:
+        pass  # Older Windows versions without shcore
+
+
 def main():
     """Main application entry point with improved error handling."""
+    _start_log_listener()
     try:
         # Configure logging first
         logging.info("Starting File Extractor Pro")
         
         # Create and configure root window
+        _load_tk()
         root = tk.Tk()
         root.title("File Extractor Pro")
         
-        # Set DPI awareness for Windows
-        try:
-            from ctypes import windll
-            windll.shcore.SetProcessDpiAwareness(1)
-        except Exception:
-            pass  # Not on Windows or other issue
+        configure_dpi_awareness()
         
         # Create application instance
         app = FileExtractorGUI(root)
@@ -820,6 +1429,8 @@ def main():
             )
             root.destroy()
         raise
+    finally:
+        _stop_log_listener()
 
 
 if __name__ == "__main__":